@@ -1,8 +1,26 @@
 
+import threading
+
 import streamlit as st
 from converter import CppToJavaConverter
 
 
+@st.cache_resource
+def get_converter(mode: str, verbose: bool):
+    """Return a long-lived converter (and its lock) shared across reruns"""
+    return CppToJavaConverter(mode=mode, verbose=verbose), threading.Lock()
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def convert_code(cpp_code: str, mode: str, verbose: bool):
+    """Convert C++ code, memoizing the Java output and report per input"""
+    converter, lock = get_converter(mode, verbose)
+    # convert() resets per-run state, so a shared converter must not be used concurrently
+    with lock:
+        java_output = converter.convert(cpp_code)
+        return java_output, converter.generate_report()
+
+
 def main():
     st.set_page_config(
         page_title="Конвертер C++ в Java",
@@ -206,11 +224,10 @@ public:
     if convert_clicked and cpp_input.strip():
         try:
             with st.spinner("Конвертируем C++ код в Java... Это может занять некоторое время."):
-                converter = CppToJavaConverter(mode=conversion_mode, verbose=verbose_output)
-                java_output = converter.convert(cpp_input)
+                java_output, report = convert_code(cpp_input, conversion_mode, verbose_output)
                 
                 st.session_state.converted_code = java_output
-                st.session_state.conversion_report = converter.generate_report()
+                st.session_state.conversion_report = report
                 st.session_state.error_message = ""
                 
                 st.success("✅ Конвертация успешно завершена!")
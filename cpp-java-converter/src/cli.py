@@ -1,12 +1,81 @@
 import argparse
 import json
+import os
 import sys
 import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Union
 import logging
+from operator import attrgetter
 
-from converter_modules.core import CppToJavaConverter
+from converter_modules.core import iter_convert_many
+
+try:
+    import orjson
+except ImportError:  # optional: only makes JSON reports faster
+    orjson = None
+
+
+CPP_EXTENSIONS = frozenset({'.cpp', '.cxx', '.cc', '.c', '.h', '.hpp', '.hxx'})
+# Same extensions as a tuple for str.endswith
+_CPP_SUFFIXES = tuple(sorted(CPP_EXTENSIONS))
+
+# Distinct warnings/errors kept per report; further new messages are only counted
+_MAX_REPORTED_MESSAGES = 10000
+
+# Per-file line of the TXT report and the two FileInfo fields it shows
+_FILE_LINE = "  - %s -> %s\n"
+_FILE_PATHS = attrgetter('original_path', 'output_path')
+
+
+class _MessageSet(dict):
+    """Insertion-ordered, bounded set of report messages (dict keys); overflow is only counted"""
+
+    def __init__(self, limit: int = _MAX_REPORTED_MESSAGES):
+        super().__init__()
+        self.limit = limit
+        self.suppressed = 0
+
+    def add(self, message: str):
+        if message in self:
+            return
+        if len(self) < self.limit:
+            self[message] = None
+        else:
+            self.suppressed += 1
+
+
+def _message_count(report_data: Dict[str, Any], kind: str) -> int:
+    """Total number of warnings or errors, including those left out of the report"""
+    return len(report_data.get(kind, [])) + report_data.get('suppressed_messages', {}).get(kind, 0)
+
+
+
+class FileInfo(NamedTuple):
+    """Report entry of one converted file; paths are stringified only when written"""
+    original_path: Path
+    output_path: Path
+    processing_time: float
+    size_original: int
+    size_translated: int
+    ast_nodes_processed: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "original_path": str(self.original_path),
+            "output_path": str(self.output_path),
+            "processing_time": self.processing_time,
+            "size_original": self.size_original,
+            "size_translated": self.size_translated,
+            "ast_nodes_processed": self.ast_nodes_processed
+        }
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize report data to JSON text, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(value, indent=2, ensure_ascii=False)
 
 
 def setup_logging(verbose: bool):
@@ -21,7 +90,6 @@ def setup_logging(verbose: bool):
 
 def validate_input_files(input_paths: List[str]) -> List[Path]:
     """Validate input files exist and have valid extensions"""
-    valid_extensions = {'.cpp', '.cxx', '.cc', '.c', '.h', '.hpp', '.hxx'}
     validated_paths = []
     
     for path_str in input_paths:
@@ -31,7 +99,7 @@ def validate_input_files(input_paths: List[str]) -> List[Path]:
             print(f"Error: Input file does not exist: {path_str}", file=sys.stderr)
             continue
             
-        if path.suffix.lower() not in valid_extensions:
+        if path.suffix.lower() not in CPP_EXTENSIONS:
             print(f"Warning: File extension '{path.suffix}' may not be a C++ file: {path_str}")
             
         validated_paths.append(path)
@@ -45,32 +113,65 @@ def write_report(report_data: Dict[str, Any], report_path: str, format_type: str
     
     if format_type.lower() == "json":
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+            f.write(_json_dumps(dict(report_data, files_processed=[
+                file_info.to_dict() for file_info in report_data.get('files_processed', [])
+            ])))
     else:  
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write("C++ to Java Translation Report\n")
-            f.write("=" * 40 + "\n\n")
-            
-            f.write(f"Translation Time: {report_data.get('translation_time', 'N/A')} seconds\n")
-            f.write(f"Files Processed: {len(report_data.get('files_processed', []))}\n")
-            f.write(f"Total AST Nodes: {report_data.get('total_ast_nodes', 0)}\n")
-            f.write(f"Warnings: {len(report_data.get('warnings', []))}\n")
-            f.write(f"Errors: {len(report_data.get('errors', []))}\n\n")
-            
-            if report_data.get('files_processed'):
-                f.write("Processed Files:\n")
-                for file_info in report_data['files_processed']:
-                    f.write(f"  - {file_info['original_path']} -> {file_info['output_path']}\n")
-            
-            if report_data.get('warnings'):
-                f.write("\nWarnings:\n")
-                for warning in report_data['warnings']:
-                    f.write(f"  - {warning}\n")
-            
-            if report_data.get('errors'):
-                f.write("\nErrors:\n")
-                for error in report_data['errors']:
-                    f.write(f"  - {error}\n")
+        # Built in memory and written with a single call
+        lines = [
+            "C++ to Java Translation Report\n",
+            "=" * 40 + "\n\n",
+            f"Translation Time: {report_data.get('translation_time', 'N/A')} seconds\n",
+            f"Files Processed: {len(report_data.get('files_processed', []))}\n",
+            f"Total AST Nodes: {report_data.get('total_ast_nodes', 0)}\n",
+            f"Warnings: {_message_count(report_data, 'warnings')}\n",
+            f"Errors: {_message_count(report_data, 'errors')}\n\n"
+        ]
+        
+        suppressed = report_data.get('suppressed_messages', {})
+        if any(suppressed.values()):
+            lines.append(f"Not listed (over {_MAX_REPORTED_MESSAGES} distinct messages): "
+                         f"{suppressed.get('warnings', 0)} warnings, {suppressed.get('errors', 0)} errors\n\n")
+        
+        if report_data.get('files_processed'):
+            lines.append("Processed Files:\n")
+            lines.extend(_FILE_LINE % _FILE_PATHS(file_info) for file_info in report_data['files_processed'])
+        
+        if report_data.get('warnings'):
+            lines.append("\nWarnings:\n")
+            lines.extend(f"  - {warning}\n" for warning in report_data['warnings'])
+        
+        if report_data.get('errors'):
+            lines.append("\nErrors:\n")
+            lines.extend(f"  - {error}\n" for error in report_data['errors'])
+        
+        path.write_text(''.join(lines), encoding='utf-8')
+
+
+def _write_java_file(cpp_file: Path, conversion: Dict[str, Any], output_dir: Path) -> Union[FileInfo, str]:
+    """Write the Java file of one finished conversion; returns the file info or an error message"""
+    logger = logging.getLogger(__name__)
+    if conversion['error'] is not None:
+        return f"Failed to convert {cpp_file}: {conversion['error']}"
+
+    java_result = conversion['java_code']
+
+    # Генерируем имя выходного файла напрямую
+    output_file = output_dir / f"{cpp_file.stem}.java"
+    try:
+        output_file.write_bytes(java_result.encode('utf-8'))
+    except OSError as e:
+        return f"Failed to convert {cpp_file}: {str(e)}"
+
+    logger.info("Successfully converted: %s -> %s", cpp_file, output_file)
+    return FileInfo(
+        cpp_file,
+        output_file,
+        conversion['processing_time'],
+        conversion['size_original'],
+        len(java_result),
+        conversion['ast_nodes']
+    )
 
 
 def main():
@@ -112,6 +213,18 @@ Examples:
         help="Generate translation report to specified file (JSON or TXT)"
     )
     
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Number of files converted in parallel (default: number of CPUs)"
+    )
+    
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for caching parsed and transformed sources between runs (e.g. ~/.cache/cpp2java)"
+    )
+    
     parser.add_argument(
         "--verbose", 
         "-v", 
@@ -126,7 +239,7 @@ Examples:
     logger = logging.getLogger(__name__)
     
     logger.info("Starting C++ to Java conversion...")
-    logger.debug(f"Arguments: {args}")
+    logger.debug("Arguments: %s", args)
     
     
     input_paths = []
@@ -135,10 +248,9 @@ Examples:
         if input_path.is_file():
             input_paths.append(input_path)
         elif input_path.is_dir():
-            
-            cpp_extensions = {'.cpp', '.cxx', '.cc', '.c', '.h', '.hpp', '.hxx'}
-            for ext in cpp_extensions:
-                input_paths.extend(input_path.rglob(f"*{ext}"))
+            # One walk over the tree instead of one recursive glob per extension
+            for root, _, files in os.walk(input_path):
+                input_paths.extend(Path(root, name) for name in files if name.endswith(_CPP_SUFFIXES))
         else:
             print(f"Error: Invalid input path: {input_arg}", file=sys.stderr)
             return 1
@@ -147,90 +259,89 @@ Examples:
         print("Error: No valid input files found", file=sys.stderr)
         return 1
     
-    logger.info(f"Found {len(input_paths)} input file(s)")
+    # The same file reached twice (listed directly and inside a directory, or via symlinks) is converted once
+    input_paths = list({path.resolve(): path for path in input_paths}.values())
+    
+    logger.info("Found %d input file(s)", len(input_paths))
     
     
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     
-    converter = CppToJavaConverter(mode=args.mode, verbose=args.verbose)
-    
-    
     report_data = {
         "start_time": time.time(),
         "files_processed": [],
         "total_ast_nodes": 0,
-        "warnings": [],
-        "errors": [],
+        # Bounded message sets; turned into lists for the report
+        "warnings": _MessageSet(),
+        "errors": _MessageSet(),
         "conversion_mode": args.mode
     }
     
     success_count = 0
     failure_count = 0
     
-    
-    for cpp_file in input_paths:
-        try:
-            logger.info(f"Processing: {cpp_file}")
-            
-            start_time = time.time()
-            
-            
-            with open(cpp_file, 'r', encoding='utf-8') as f:
-                cpp_source = f.read()
-            
-            
-            java_result = converter.convert(cpp_source, str(cpp_file))
-            
-            
-            processing_time = time.time() - start_time
-
-            # Генерируем имя выходного файла напрямую
-            output_file = output_dir / f"{cpp_file.stem}.java"
+    cache_dir = os.path.expanduser(args.cache_dir) if args.cache_dir else None
+    
+    strict_mode = args.mode == "strict"
+    
+    # Files are independent, so convert them in worker processes (one converter per worker)
+    conversions = iter_convert_many(input_paths, args.mode, cache_dir, args.jobs, args.verbose)
+    # Results are stored by input index; failed files hold their error message
+    results: List[Union[FileInfo, str, None]] = [None] * len(input_paths)
+    # Finished conversions are handled in input order, so strict mode stops exactly where a
+    # sequential run would: every earlier file is written, no later one is
+    pending: Dict[int, Dict[str, Any]] = {}
+    next_index = 0
+    stopped = False
+    for index, conversion in conversions:
+        pending[index] = conversion
+        while next_index in pending and not stopped:
+            result = results[next_index] = _write_java_file(input_paths[next_index], pending.pop(next_index),
+                                                            output_dir)
+            stopped = strict_mode and isinstance(result, str)
+            next_index += 1
+        if stopped:
+            # Later files are dropped; closing the iterator cancels those not started yet
+            conversions.close()
+            break
+    
+    for result in results:
+        if result is None:
+            continue
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(java_result)
-            
-            
-            file_info = {
-                "original_path": str(cpp_file),
-                "output_path": str(output_file),
-                "processing_time": processing_time,
-                "size_original": len(cpp_source),
-                "size_translated": len(java_result),
-                "ast_nodes_processed": getattr(converter, 'last_conversion_stats', {}).get('ast_nodes', 0)
-            }
-            
-            report_data["files_processed"].append(file_info)
-            report_data["total_ast_nodes"] += file_info["ast_nodes_processed"]
-            
-            success_count += 1
-            logger.info(f"Successfully converted: {cpp_file} -> {output_file}")
-            
-        except Exception as e:
-            error_msg = f"Failed to convert {cpp_file}: {str(e)}"
+        if isinstance(result, str):
+            error_msg = result
             logger.error(error_msg)
-            report_data["errors"].append(error_msg)
+            report_data["errors"].add(error_msg)
             failure_count += 1
             
-            if args.mode == "strict":
+            if strict_mode:
                 print(f"Error in strict mode: {error_msg}", file=sys.stderr)
-                return 1
+        else:
+            report_data["total_ast_nodes"] += result.ast_nodes_processed
+            success_count += 1
     
     
     report_data["end_time"] = time.time()
     report_data["translation_time"] = report_data["end_time"] - report_data["start_time"]
     report_data["success_count"] = success_count
     report_data["failure_count"] = failure_count
-    report_data["warnings"] = list(set(report_data["warnings"]))  
-    report_data["errors"] = list(set(report_data["errors"]))
+    # Messages over the cap are only counted, in a field of their own
+    report_data["suppressed_messages"] = {
+        "warnings": report_data["warnings"].suppressed,
+        "errors": report_data["errors"].suppressed
+    }
+    report_data["warnings"] = list(report_data["warnings"])
+    report_data["errors"] = list(report_data["errors"])
+    report_data["files_processed"] = [result for result in results if isinstance(result, FileInfo)]
     
     
     if args.report:
         report_format = "json" if args.report.endswith('.json') else "txt"
         write_report(report_data, args.report, report_format)
-        logger.info(f"Report written to: {args.report}")
+        logger.info("Report written to: %s", args.report)
     
     
     print("\nConversion Summary:")
@@ -239,13 +350,15 @@ Examples:
     print(f"  Total time: {report_data['translation_time']:.2f}s")
     print(f"  Total AST nodes processed: {report_data['total_ast_nodes']}")
     
-    if report_data["warnings"]:
-        print(f"  Warnings: {len(report_data['warnings'])}")
+    warnings_count = _message_count(report_data, "warnings")
+    if warnings_count:
+        print(f"  Warnings: {warnings_count}")
     
-    if report_data["errors"]:
-        print(f"  Errors: {len(report_data['errors'])}")
+    errors_count = _message_count(report_data, "errors")
+    if errors_count:
+        print(f"  Errors: {errors_count}")
     
-    return 0 if failure_count == 0 or args.mode == "flexible" else 1
+    return 0 if failure_count == 0 or not strict_mode else 1
 
 
 if __name__ == "__main__":
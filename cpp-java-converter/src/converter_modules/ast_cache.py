@@ -0,0 +1,118 @@
+"""Persistent on-disk caches of transformed ASTs and saved translation units"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import clang.cindex
+from typing import Any, List, Optional, Tuple
+
+
+# Bump whenever handler output changes so stale entries are never reused
+_AST_CACHE_VERSION = 4
+
+_AST_CACHE_FILE = 'ast.sqlite'
+
+
+def _ast_cache_key(self, cpp_code: str, source_file_path: Optional[str] = None) -> str:
+    """Content address of a conversion: source text plus everything that shapes the AST"""
+    digest = hashlib.sha256(cpp_code.encode('utf-8'))
+    digest.update(f"\0{_AST_CACHE_VERSION}\0{self.mode}\0{source_file_path or ''}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _get_ast_cache(self) -> sqlite3.Connection:
+    """Open the cache database on first use"""
+    if self._ast_cache is None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        connection = sqlite3.connect(os.path.join(self.cache_dir, _AST_CACHE_FILE), check_same_thread=False)
+        # Entries are JSON rather than pickle: the directory is user-supplied and must not run code
+        connection.execute('CREATE TABLE IF NOT EXISTS ast_json (hash TEXT PRIMARY KEY, entry TEXT NOT NULL)')
+        self._ast_cache = connection
+    return self._ast_cache
+
+
+def _include_stamps(tu) -> List[List[Any]]:
+    """[path, mtime_ns] of every file included by a translation unit"""
+    paths = {include.include.name for include in tu.get_includes()}
+    return [[path, os.stat(path).st_mtime_ns] for path in sorted(paths)]
+
+
+def _includes_unchanged(includes: List[List[Any]]) -> bool:
+    """Whether every included file still has the modification time it was cached with"""
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime_ns for path, mtime_ns in includes)
+    except OSError:
+        return False
+
+
+def _load_cached_ast(self, key: str) -> Optional[Tuple[List[Any], List[str], int]]:
+    """Return (java_ast, warnings, ast_node_count) stored under key, if any"""
+    row = self._get_ast_cache().execute('SELECT entry FROM ast_json WHERE hash = ?', (key,)).fetchone()
+    if row is None:
+        return None
+    try:
+        entry = json.loads(row[0])
+        # Declarations from included headers are translated too, so an edited header is a miss
+        if not _includes_unchanged(entry['includes']):
+            return None
+        return entry['java_ast'], entry['warnings'], entry['ast_nodes']
+    except (ValueError, KeyError, TypeError):
+        # Unreadable entry: treat as a miss, it is overwritten after the reparse
+        return None
+
+
+def _store_cached_ast(self, key: str, java_ast: List[Any], tu) -> None:
+    """Store the transformed AST together with the state and included files it was produced with"""
+    try:
+        entry = json.dumps({
+            'java_ast': java_ast,
+            'warnings': self.warnings,
+            'ast_nodes': self.ast_node_count,
+            'includes': _include_stamps(tu)
+        })
+    except OSError:
+        # An included file vanished after the parse; nothing reliable to store
+        return
+    connection = self._get_ast_cache()
+    try:
+        with connection:
+            connection.execute('INSERT OR REPLACE INTO ast_json (hash, entry) VALUES (?, ?)', (key, entry))
+    except sqlite3.OperationalError:
+        # Another process holds the write lock; the entry is simply stored next time
+        pass
+
+
+def _saved_tu_path(self, source_file_path: str) -> str:
+    """Location of the saved translation unit for a source file"""
+    path_digest = hashlib.sha256(os.path.realpath(source_file_path).encode('utf-8')).hexdigest()
+    return os.path.join(self.cache_dir, f"{path_digest[:32]}.ast")
+
+
+def _load_saved_tu(self, source_file_path: str):
+    """Load the saved translation unit of a source file unless the source is newer"""
+    from .core import _get_index
+    ast_path = _saved_tu_path(self, source_file_path)
+    try:
+        if os.path.getmtime(ast_path) < os.path.getmtime(source_file_path):
+            return None
+        return clang.cindex.TranslationUnit.from_ast_file(ast_path, index=_get_index())
+    except (OSError, clang.cindex.TranslationUnitLoadError):
+        return None
+
+
+def _save_tu(self, tu, source_file_path: str) -> None:
+    """Save a translation unit for later conversions of the same source file"""
+    # Diagnostics are not stored in AST files, so only clean translation units
+    # can be reloaded without hiding warnings or errors
+    if any(True for _ in tu.diagnostics):
+        return
+    os.makedirs(self.cache_dir, exist_ok=True)
+    ast_path = _saved_tu_path(self, source_file_path)
+    temp_path = f"{ast_path}.{os.getpid()}.tmp"
+    try:
+        tu.save(temp_path)
+        os.replace(temp_path, ast_path)
+    except (OSError, clang.cindex.TranslationUnitSaveError):
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
@@ -1,12 +1,33 @@
 """Code generation functions for the converter"""
 
 import re
-from typing import Any, Dict, List
+from itertools import chain
+from typing import Any, Dict, List, TextIO
 
 
-def _generate_java_code(self, java_ast: List[Any]) -> str:
+# Bits of CppToJavaConverter.java_imports_mask, one per import the generator itself emits
+IMPORT_AUTOCLOSEABLE = 1 << 0
+
+# (bit, import) pairs, sorted by import name
+_BUILTIN_IMPORTS = (
+    (IMPORT_AUTOCLOSEABLE, "java.lang.AutoCloseable"),
+)
+
+
+# Field modifiers keyed by (is_static, is_const)
+_MODIFIER_COMBOS = {
+    (False, False): "",
+    (True, False): "static ",
+    (False, True): "final ",
+    (True, True): "static final ",
+}
+
+
+def _write_java_code(self, java_ast: List[Any], out: TextIO) -> None:
+    """Generate Java code from the transformed AST straight into a text stream"""
     # 1. Извлекаем package
     package_line = None
+    # Lines of all classes and of all enums, shared by every emitter instead of per-block joins
     classes = []
     enums = []
     global_functions = []
@@ -19,9 +40,9 @@ def _generate_java_code(self, java_ast: List[Any]) -> str:
             pkg_name = self._convert_namespace_to_package(element['name'])
             package_line = f"package {pkg_name};"
         elif elem_type == 'class':
-            classes.append(self._generate_java_class(element))
+            self._emit_java_class(element, classes)
         elif elem_type == 'enum':
-            enums.append(self._generate_java_enum(element))
+            self._emit_java_enum(element, enums)
         elif elem_type == 'function':
             global_functions.append(element)
         elif elem_type == 'macro_constant':
@@ -44,19 +65,7 @@ def _generate_java_code(self, java_ast: List[Any]) -> str:
             global_functions.append(element)
 
     if global_functions:
-        other_lines.append(self._generate_util_class(global_functions))
-
-    # 3. Собираем всё вместе
-    lines = []
-    if package_line:
-        lines.append(package_line)
-        lines.append("")
-
-    # Импорты (если есть)
-    if self.java_imports:
-        for imp in sorted(self.java_imports):
-            lines.append(f"import {imp};")
-        lines.append("")
+        self._emit_util_class(global_functions, other_lines)
 
     # Константы на уровне файла (в Java они должны быть внутри класса!)
     if constants:
@@ -64,15 +73,35 @@ def _generate_java_code(self, java_ast: List[Any]) -> str:
         const_class = self._generate_constants_class(constants)
         classes.insert(0, const_class)
 
-    lines.extend(classes)
-    lines.extend(enums)
-    lines.extend(other_lines)
+    imports_section = self._generate_imports()
 
-    return '\n'.join(lines)
+    # 3. Собираем всё вместе (everything is generated above, so a failure never leaves partial output)
+    write = out.write
+    # Newline owed after the last written block; dropped at the end of the file
+    pending = ""
+    if package_line:
+        write(package_line)
+        write("\n")
+        pending = "\n"
 
+    # Импорты (если есть)
+    if imports_section:
+        write(pending)
+        write(imports_section)
+        write("\n")
+        pending = "\n"
 
-def _generate_java_class(self, class_info: Dict[str, Any]) -> str:
-    java_lines = []
+    for block in chain(classes, enums, other_lines):
+        write(pending)
+        write(block)
+        pending = "\n"
+
+
+def _emit_java_class(self, class_info: Dict[str, Any], java_lines: List[str]) -> None:
+    """Append the lines of a Java class to a shared output line list"""
+    append = java_lines.append
+    to_java_type = self._cpp_to_java_type
+    to_java_name = self._cpp_name_to_java_name
 
     # Determine modifiers
     modifiers = ["public"]
@@ -90,7 +119,7 @@ def _generate_java_class(self, class_info: Dict[str, Any]) -> str:
         java_bases = []
         for base in base_classes:
             base_name = base['name']
-            java_base_name = self._cpp_name_to_java_name(base_name)
+            java_base_name = to_java_name(base_name)
             if len(java_bases) == 0:
                 java_bases.append(java_base_name)
             else:
@@ -102,7 +131,7 @@ def _generate_java_class(self, class_info: Dict[str, Any]) -> str:
     # Add AutoCloseable if destructor exists
     has_destructor = bool(class_info.get('destructors'))
     if has_destructor:
-        self.java_imports.add("java.lang.AutoCloseable")
+        self.java_imports_mask |= IMPORT_AUTOCLOSEABLE
         implements_parts.append("AutoCloseable")
 
     implements_clause = ""
@@ -110,61 +139,60 @@ def _generate_java_class(self, class_info: Dict[str, Any]) -> str:
         implements_clause = f" implements {', '.join(implements_parts)}"
 
     # Start class declaration
-    class_name = self._cpp_name_to_java_name(class_info['name'])
-    java_lines.append(f"{' '.join(modifiers)} class {class_name}{extends_clause}{implements_clause} {{")
-    java_lines.append("")
+    class_name = to_java_name(class_info['name'])
+    append(f"{' '.join(modifiers)} class {class_name}{extends_clause}{implements_clause} {{")
+    append("")
 
     # Add fields
     for field in class_info.get('members', []):
         access = field.get('access', 'private')
-        java_type = self._cpp_to_java_type(field['type'])
-        java_name = self._cpp_name_to_java_name(field['name'])
-        static_keyword = "static " if field.get('is_static', False) else ""
-        final_keyword = "final " if field.get('is_const', False) else ""
-        java_lines.append(f"    {access} {static_keyword}{final_keyword}{java_type} {java_name};")
+        java_type = to_java_type(field['type'])
+        java_name = to_java_name(field['name'])
+        field_modifiers = _MODIFIER_COMBOS[field.get('is_static', False), field.get('is_const', False)]
+        append(f"    {access} {field_modifiers}{java_type} {java_name};")
 
-    java_lines.append("")
+    append("")
 
     # Add constructors
     for constructor in class_info.get('constructors', []):
         params = ", ".join([
-            f"{self._cpp_to_java_type(p['type'])} {self._cpp_name_to_java_name(p['name'])}"
+            f"{to_java_type(p['type'])} {to_java_name(p['name'])}"
             for p in constructor.get('parameters', [])
         ])
-        java_lines.append(f"    public {class_name}({params}) {{")
-        java_lines.append("        // Constructor implementation")
-        java_lines.append("    }")
-        java_lines.append("")
+        append(f"    public {class_name}({params}) {{")
+        append("        // Constructor implementation")
+        append("    }")
+        append("")
 
     # Add destructor as close()
     if has_destructor:
-        java_lines.append("    @Override")
-        java_lines.append("    public void close() {")
-        java_lines.append("        // Emulated destructor")
-        java_lines.append("    }")
-        java_lines.append("")
+        append("    @Override")
+        append("    public void close() {")
+        append("        // Emulated destructor")
+        append("    }")
+        append("")
 
     # Add methods
     has_equals = False
+    generate_method = self._generate_java_method
     for method in class_info.get('methods', []):
-        method_lines = self._generate_java_method(method, class_name)
-        # Check if this is equals
-        if any("public boolean equals(" in line for line in method_lines):
+        method_lines = generate_method(method, class_name)
+        # Check if this is equals (the signature is always the first line)
+        if "public boolean equals(" in method_lines[0]:
             has_equals = True
         java_lines.extend(method_lines)
-        java_lines.append("")
+        append("")
 
     # Add hashCode if equals is present
     if has_equals:
-        java_lines.append("    @Override")
-        java_lines.append("    public int hashCode() {")
-        java_lines.append("        // TODO: Generate proper hash code based on fields")
-        java_lines.append("        return super.hashCode();")
-        java_lines.append("    }")
-        java_lines.append("")
+        append("    @Override")
+        append("    public int hashCode() {")
+        append("        // TODO: Generate proper hash code based on fields")
+        append("        return super.hashCode();")
+        append("    }")
+        append("")
 
-    java_lines.append("}")
-    return '\n'.join(java_lines)
+    append("}")
 
 
 def _generate_java_method(self, method_info: Dict[str, Any], class_name: str) -> List[str]:
@@ -205,14 +233,14 @@ def _generate_java_method(self, method_info: Dict[str, Any], class_name: str) ->
         if '@Override' not in modifiers:
             modifiers.insert(0, '@Override')
     else:
-        return_type = self._cpp_to_java_type(method_info['return_type'])
+        to_java_type = self._cpp_to_java_type
+        to_java_name = self._cpp_name_to_java_name
+        return_type = to_java_type(method_info['return_type'])
         # Handle parameters normally
-        params = []
-        for param in method_info.get('parameters', []):
-            param_type = self._cpp_to_java_type(param['type'])
-            param_name = self._cpp_name_to_java_name(param['name'])
-            params.append(f"{param_type} {param_name}")
-        param_str = ", ".join(params)
+        param_str = ", ".join([
+            f"{to_java_type(param['type'])} {to_java_name(param['name'])}"
+            for param in method_info.get('parameters', [])
+        ])
 
     # Generate method
     java_lines = []
@@ -231,12 +259,14 @@ def _generate_java_method(self, method_info: Dict[str, Any], class_name: str) ->
     return java_lines
 
 
-def _generate_util_class(self, functions: List[Dict[str, Any]]) -> str:
-    """Generate a single utility class containing all global and template functions"""
-    if not functions:
-        return ""
-
-    lines = ["public class Util {"]
+def _emit_util_class(self, functions: List[Dict[str, Any]], lines: List[str]) -> None:
+    """Append the lines of the utility class to a shared output line list"""
+    append = lines.append
+    append("public class Util {")
+    to_java_type = self._cpp_to_java_type
+    to_java_name = self._cpp_name_to_java_name
+    map_template_type = self._map_template_type
+    get_default_value = self._get_default_value
 
     for func in functions:
         is_template = func.get('kind') == 'function_template'
@@ -250,44 +280,39 @@ def _generate_util_class(self, functions: List[Dict[str, Any]]) -> str:
             # Используем исходную функцию внутри
             inner_func = func['function_info']
             access = inner_func.get('access', 'public')
-            return_type = self._map_template_type(inner_func['return_type'], template_params)
-            func_name = self._cpp_name_to_java_name(inner_func['name'])
-
-            params = []
-            for param in inner_func.get('parameters', []):
-                param_type = self._map_template_type(param['type'], template_params)
-                param_name = self._cpp_name_to_java_name(param['name'])
-                params.append(f"{param_type} {param_name}")
-            param_str = ", ".join(params)
-
-            lines.append(f"    {access} static {generics_clause}{return_type} {func_name}({param_str}) {{")
-            lines.append("        // Template function implementation")
+            return_type = map_template_type(inner_func['return_type'], template_params)
+            func_name = to_java_name(inner_func['name'])
+
+            param_str = ", ".join([
+                f"{map_template_type(param['type'], template_params)} {to_java_name(param['name'])}"
+                for param in inner_func.get('parameters', [])
+            ])
+
+            append(f"    {access} static {generics_clause}{return_type} {func_name}({param_str}) {{")
+            append("        // Template function implementation")
             if return_type != 'void':
-                lines.append(f"        return {self._get_default_value(return_type)}; // TODO: Implement")
-            lines.append("    }")
+                append(f"        return {get_default_value(return_type)}; // TODO: Implement")
+            append("    }")
 
         else:
             # Обработка обычной функции
             access = func.get('access', 'public')
-            return_type = self._cpp_to_java_type(func['return_type'])
-            func_name = self._cpp_name_to_java_name(func['name'])
-            params = []
-            for param in func.get('parameters', []):
-                param_type = self._cpp_to_java_type(param['type'])
-                param_name = self._cpp_name_to_java_name(param['name'])
-                params.append(f"{param_type} {param_name}")
-            param_str = ", ".join(params)
-
-            lines.append(f"    {access} static {return_type} {func_name}({param_str}) {{")
-            lines.append("        // Function implementation")
+            return_type = to_java_type(func['return_type'])
+            func_name = to_java_name(func['name'])
+            param_str = ", ".join([
+                f"{to_java_type(param['type'])} {to_java_name(param['name'])}"
+                for param in func.get('parameters', [])
+            ])
+
+            append(f"    {access} static {return_type} {func_name}({param_str}) {{")
+            append("        // Function implementation")
             if return_type != 'void':
-                lines.append(f"        return {self._get_default_value(return_type)}; // TODO: Implement")
-            lines.append("    }")
+                append(f"        return {get_default_value(return_type)}; // TODO: Implement")
+            append("    }")
 
-        lines.append("")  # Empty line between methods
+        append("")  # Empty line between methods
 
-    lines.append("}")
-    return '\n'.join(lines)
+    append("}")
 
 
 def _generate_globals_class(self, variables: List[Dict[str, Any]]) -> str:
@@ -296,34 +321,39 @@ def _generate_globals_class(self, variables: List[Dict[str, Any]]) -> str:
         return ""
 
     lines = ["public class Globals {"]
+    to_java_type = self._cpp_to_java_type
+    to_java_name = self._cpp_name_to_java_name
+    get_default_value = self._get_default_value
 
     for var in variables:
         access = 'public'
-        static_keyword = "static " if var.get('is_static', True) else ""
-        final_keyword = "final " if var.get('is_const', False) else ""
-        java_type = self._cpp_to_java_type(var['type'])
-        java_name = self._cpp_name_to_java_name(var['name'])
+        modifiers = _MODIFIER_COMBOS[var.get('is_static', True), var.get('is_const', False)]
+        java_type = to_java_type(var['type'])
+        java_name = to_java_name(var['name'])
 
         # Добавляем инициализацию по умолчанию
-        default_value = self._get_default_value(java_type)
-        lines.append(f"    {access} {static_keyword}{final_keyword}{java_type} {java_name} = {default_value};")
+        default_value = get_default_value(java_type)
+        lines.append(f"    {access} {modifiers}{java_type} {java_name} = {default_value};")
 
     lines.append("}")
     return '\n'.join(lines)
 
 
-def _generate_java_enum(self, enum_info: Dict[str, Any]) -> str:
-    """Generate Java enum from C++ enum"""
+def _emit_java_enum(self, enum_info: Dict[str, Any], lines: List[str]) -> None:
+    """Append the lines of a Java enum to a shared output line list"""
     enum_name = self._cpp_name_to_java_name(enum_info['name'])
     values = enum_info.get('values', [])
 
     if not values:
-        return f"public enum {enum_name} {{\n    // Empty enum\n}}"
+        lines.append(f"public enum {enum_name} {{")
+        lines.append("    // Empty enum")
+        lines.append("}")
+        return
 
     # Проверяем, есть ли нестандартные значения (требуется тело enum)
     has_custom_values = any(val.get('value', i) != i for i, val in enumerate(values))
 
-    lines = [f"public enum {enum_name} {{"]
+    lines.append(f"public enum {enum_name} {{")
 
     # Генерируем значения
     value_lines = []
@@ -355,19 +385,16 @@ def _generate_java_enum(self, enum_info: Dict[str, Any]) -> str:
         lines.append(", ".join(v.strip() for v in value_lines) + "")
 
     lines.append("}")
-    return '\n'.join(lines)
 
 
 def _generate_imports(self) -> str:
     """Generate Java import statements based on needed utilities"""
-    if not self.java_imports:
+    mask = self.java_imports_mask
+    if not mask:
         return ""
 
-    imports = []
-    for imp in sorted(self.java_imports):
-        imports.append(f"import {imp};")
-
-    return '\n'.join(imports) + '\n\n' if imports else ""
+    # _BUILTIN_IMPORTS is sorted by name, so no sorting is needed
+    return '\n'.join([f"import {name};" for bit, name in _BUILTIN_IMPORTS if mask & bit])
 
 
 def _generate_constants_class(self, constants: List[str]) -> str:
@@ -382,9 +409,8 @@ def _generate_constants_class(self, constants: List[str]) -> str:
 def _generate_java_variable(self, variable_info: Dict[str, Any]) -> str:
     """Generate Java variable from C++ variable info"""
     access = "public"
-    static_keyword = "static " if variable_info.get('is_static', True) else ""
-    final_keyword = "final " if variable_info.get('is_const', False) else ""
+    modifiers = _MODIFIER_COMBOS[variable_info.get('is_static', True), variable_info.get('is_const', False)]
     java_type = self._cpp_to_java_type(variable_info['type'])
     java_name = self._cpp_name_to_java_name(variable_info['name'])
 
-    return f"    {access} {static_keyword}{final_keyword}{java_type} {java_name};"
\ No newline at end of file
+    return f"    {access} {modifiers}{java_type} {java_name};"
\ No newline at end of file
@@ -1,11 +1,45 @@
 import clang.cindex
 import re
 import json
-from typing import Any, Dict, List, Optional
-import tempfile
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 import logging
 from datetime import datetime
 import time
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+_CK = clang.cindex.CursorKind
+
+# Function-like declarations: their parameters and bodies hold nothing the walk translates
+# (function templates read their own template parameters in their handler)
+_NO_DESCEND_KINDS = frozenset({
+    _CK.FUNCTION_DECL, _CK.CXX_METHOD, _CK.CONSTRUCTOR, _CK.DESTRUCTOR, _CK.CONVERSION_FUNCTION,
+    _CK.FUNCTION_TEMPLATE
+})
+
+# Structural cursors that are consumed by their parent's handler
+_SKIP_KINDS = frozenset({
+    _CK.CXX_ACCESS_SPEC_DECL, _CK.CXX_BASE_SPECIFIER, _CK.CXX_OVERRIDE_ATTR, _CK.CXX_FINAL_ATTR
+})
+
+# libclang index shared by every converter; created on first use
+_INDEX = None
+
+# Name under which in-memory sources are handed to libclang
+_UNSAVED_FILENAME = '<input>.cpp'
+
+# Compilation errors listed before flexible-mode validation gives up
+_MAX_REPORTED_ERRORS = 64
+
+
+def _get_index() -> clang.cindex.Index:
+    """Return the process-wide libclang index, creating it on first use"""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = clang.cindex.Index.create()
+    return _INDEX
 
 
 class CppToJavaConverter:
@@ -14,31 +48,64 @@ class CppToJavaConverter:
     Implements AST-based parsing with libclang and comprehensive transformation rules
     """
 
-    def __init__(self, mode: str = "strict", verbose: bool = False):
+    def __init__(self, mode: str = "strict", verbose: bool = False, cache_dir: Optional[str] = None):
         """
         Initialize converter with specified mode
 
         Args:
             mode (str): "strict" or "flexible" conversion mode
             verbose (bool): Enable verbose logging
+            cache_dir (str, optional): Directory for the persistent AST cache (disabled if None)
         """
 
 
         self.mode = mode
         self.verbose = verbose
+        self.cache_dir = cache_dir
+        self._ast_cache = None
         self.logger = logging.getLogger(__name__) if verbose else logging.getLogger()
 
         # Initialize tracking variables
+        self.reset_per_file_state()
+        self.last_conversion_stats = {}
+        # AST nodes processed by the latest conversion, including failed ones
+        self.last_ast_nodes = 0
+        self._last_end_time = None
+
+        # Map cursor kinds to their handlers once instead of an if/elif cascade per node
+        self._handlers = {
+            _CK.CLASS_DECL: self._handle_class_declaration,
+            _CK.FUNCTION_DECL: self._handle_function_declaration,
+            _CK.VAR_DECL: self._handle_variable_declaration,
+            _CK.NAMESPACE: self._handle_namespace,
+            _CK.TEMPLATE_TYPE_PARAMETER: self._handle_template_parameter,
+            _CK.CONSTRUCTOR: self._handle_constructor,
+            _CK.DESTRUCTOR: self._handle_destructor,
+            _CK.TYPEDEF_DECL: self._handle_typedef,
+            _CK.MACRO_DEFINITION: self._handle_macro_definition,
+            _CK.UNION_DECL: lambda node: self._handle_unsupported_feature("union declaration", node),
+            _CK.ENUM_DECL: self._handle_enum_declaration,
+            _CK.CLASS_TEMPLATE: self._handle_class_template,
+            _CK.FUNCTION_TEMPLATE: self._handle_function_template,
+            _CK.CONVERSION_FUNCTION: self._handle_conversion_function,
+        }
+
+
+    def reset_per_file_state(self) -> None:
+        """
+        Clear everything collected for the previous file
+
+        The libclang index and persistent caches are kept, so one converter
+        can be reused across any number of files.
+        """
         self.classes = {}
         self.variables = {}
         self.functions = {}
         self.current_scope = []
-        self.java_imports = set()
+        self.java_imports_mask = 0
         self.warnings = []
         self.errors = []
         self.ast_node_count = 0
-        self.last_conversion_stats = {}
-
 
     def convert(self, cpp_code: str, source_file_path: Optional[str] = None) -> str:
         """
@@ -51,92 +118,103 @@ class CppToJavaConverter:
         Returns:
             str: Converted Java source code
         """
+        out = io.StringIO()
+        self.convert_stream(cpp_code, out, source_file_path)
+        return out.getvalue()
+
+    def convert_stream(self, cpp_code: str, out_fp: TextIO, source_file_path: Optional[str] = None) -> None:
+        """
+        Convert C++ code to Java code, writing the result to a text stream
+
+        Args:
+            cpp_code (str): Input C++ source code
+            out_fp (TextIO): Writable text stream receiving the Java source code
+            source_file_path (str, optional): Path to source file for context
+        """
         # Reset state for new conversion
-        self.classes = {}
-        self.variables = {}
-        self.functions = {}
-        self.current_scope = []
-        self.java_imports = set()
-        self.warnings = []
-        self.errors = []
-        self.ast_node_count = 0
+        self.reset_per_file_state()
 
         try:
-            # Parse C++ code using libclang
-            ast = self._parse_with_libclang(cpp_code, source_file_path)
+            # Reuse a previously transformed AST for identical input
+            cache_key = self._ast_cache_key(cpp_code, source_file_path) if self.cache_dir else None
+            cached = self._load_cached_ast(cache_key) if cache_key else None
 
-            # Transform AST to Java representation
-            java_ast = self._transform_ast(ast)
+            if cached is not None:
+                java_ast, self.warnings, self.ast_node_count = cached
+            else:
+                # Parse C++ code using libclang
+                ast = self._parse_with_libclang(cpp_code, source_file_path)
 
-            # Generate Java code from transformed AST
-            java_code = self._generate_java_code(java_ast)
+                # Transform AST to Java representation
+                java_ast = self._transform_ast(ast)
 
-            # Generate imports section
-            imports_section = self._generate_imports()
+                if cache_key:
+                    self._store_cached_ast(cache_key, java_ast, ast)
 
-            # Combine imports and main code
-            full_java_code = imports_section + java_code
+            # Generate Java code (package, imports and declarations) from transformed AST
+            self._write_java_code(java_ast, out_fp)
 
             # Record statistics
+            self._last_end_time = time.time()
+            self.last_ast_nodes = self.ast_node_count
             self.last_conversion_stats = {
                 'ast_nodes': self.ast_node_count,
                 'warnings_count': len(self.warnings),
                 'errors_count': len(self.errors),
-                'conversion_time': datetime.now().isoformat()
+                'conversion_time': datetime.fromtimestamp(self._last_end_time).isoformat()
             }
 
-            return full_java_code
-
         except Exception as e:
+            self._last_end_time = time.time()
+            self.last_ast_nodes = self.ast_node_count
             error_msg = f"Conversion failed: {str(e)}"
             self.errors.append(error_msg)
             if self.mode == "strict":
                 raise
             else:
-                # In flexible mode, return a stub with error comment
-                return f"// TODO: Manual fix required - conversion failed due to: {str(e)}\n// Original code was not converted."
+                # In flexible mode, emit a stub with error comment
+                out_fp.write(f"// TODO: Manual fix required - conversion failed due to: {str(e)}\n// Original code was not converted.")
 
     def _parse_with_libclang(self, cpp_code: str, source_file_path: Optional[str] = None) -> Any:
         """Parse C++ code using libclang and return AST"""
-        # Write temporary file for libclang to parse
-
-        if source_file_path is None:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.cpp', delete=False) as temp_file:
-                temp_file.write(cpp_code)
-                temp_filename = temp_file.name
-        else:
-            temp_filename = source_file_path  # Use provided path if available
-
-        try:
-            # Create index and translation unit
-            index = clang.cindex.Index.create()
+        # Unchanged source files are loaded from their saved translation unit
+        save_tu = self.cache_dir is not None and source_file_path is not None
+        tu = self._load_saved_tu(source_file_path) if save_tu else None
 
+        if tu is None:
             # Parse with standard C++17
             args = ['-std=c++17', '-I/usr/include/c++/v1', '-I/usr/include']  # Common include paths
 
-            tu = index.parse(temp_filename, args=args)
+            if source_file_path is None:
+                # Parse straight from memory instead of a temporary file
+                tu = _get_index().parse(_UNSAVED_FILENAME, args=args,
+                                        unsaved_files=[(_UNSAVED_FILENAME, cpp_code)])
+            else:
+                tu = _get_index().parse(source_file_path, args=args)
 
             if not tu.cursor:
                 raise ValueError("Failed to parse C++ code - invalid syntax")
 
-            # Validate AST
-            self._validate_ast(tu)
+            if save_tu:
+                self._save_tu(tu, source_file_path)
 
-            return tu
+        # Validate AST
+        self._validate_ast(tu)
 
-        finally:
-            # Clean up temp file if we created one
-            if source_file_path is None:
-                import os
-                os.unlink(temp_filename)
+        return tu
 
     def _validate_ast(self, tu) -> bool:
         """Validate AST for semantic correctness"""
         diagnostics = []
+        # Strict mode fails on the first error, so there is no point in marshaling the rest
+        max_errors = 1 if self.mode == "strict" else _MAX_REPORTED_ERRORS
         for diag in tu.diagnostics:
-            if diag.severity >= clang.cindex.Diagnostic.Error:
+            severity = diag.severity
+            if severity >= clang.cindex.Diagnostic.Error:
                 diagnostics.append(f"Error: {diag.spelling} at {diag.location.file}:{diag.location.line}")
-            elif diag.severity >= clang.cindex.Diagnostic.Warning:
+                if len(diagnostics) >= max_errors:
+                    break
+            elif severity >= clang.cindex.Diagnostic.Warning:
                 self.warnings.append(f"Warning: {diag.spelling} at {diag.location.file}:{diag.location.line}")
 
         if diagnostics:
@@ -147,51 +225,67 @@ class CppToJavaConverter:
     def _transform_ast(self, tu) -> List[Any]:
         """Transform C++ AST to internal representation suitable for Java generation"""
         java_ast = []
-
-        def traverse(node, depth=0):
+        handlers = self._handlers
+        # Resolved once: quiet conversions skip the debug branch with a local test
+        debug = self.logger.debug if self.verbose else None
+
+        # Iterative pre-order walk: no Python frame per node and no recursion limit
+        stack = [tu.cursor]
+        while stack:
+            node = stack.pop()
             self.ast_node_count += 1
 
             # Handle different kinds of declarations
-            if node.kind == clang.cindex.CursorKind.CLASS_DECL:
-                java_ast.append(self._handle_class_declaration(node))
-            elif node.kind == clang.cindex.CursorKind.FUNCTION_DECL:
-                java_ast.append(self._handle_function_declaration(node))
-            elif node.kind == clang.cindex.CursorKind.VAR_DECL:
-                java_ast.append(self._handle_variable_declaration(node))
-            elif node.kind == clang.cindex.CursorKind.NAMESPACE:
-                java_ast.append(self._handle_namespace(node))
-            elif node.kind == clang.cindex.CursorKind.TEMPLATE_TYPE_PARAMETER:
-                java_ast.append(self._handle_template_parameter(node))
-            elif node.kind == clang.cindex.CursorKind.CONSTRUCTOR:
-                java_ast.append(self._handle_constructor(node))
-            elif node.kind == clang.cindex.CursorKind.DESTRUCTOR:
-                java_ast.append(self._handle_destructor(node))
-            elif node.kind == clang.cindex.CursorKind.TYPEDEF_DECL:
-                java_ast.append(self._handle_typedef(node))
-            elif node.kind == clang.cindex.CursorKind.MACRO_DEFINITION:
-                java_ast.append(self._handle_macro_definition(node))
-            elif node.kind == clang.cindex.CursorKind.UNION_DECL:
-                self._handle_unsupported_feature("union declaration", node)
-            elif node.kind == clang.cindex.CursorKind.ENUM_DECL:
-                java_ast.append(self._handle_enum_declaration(node))
-            elif node.kind == clang.cindex.CursorKind.CLASS_TEMPLATE:
-                java_ast.append(self._handle_class_template(node))
-            elif node.kind == clang.cindex.CursorKind.FUNCTION_TEMPLATE:
-                java_ast.append(self._handle_function_template(node))
-            elif node.kind == clang.cindex.CursorKind.CONVERSION_FUNCTION:
-                java_ast.append(self._handle_conversion_function(node))
-            else:
+            kind = node.kind
+            handler = handlers.get(kind)
+            if handler is not None:
+                result = handler(node)
+                if result is not None:
+                    java_ast.append(result)
+            elif debug is not None and kind not in _SKIP_KINDS:
                 # Log unhandled node types for debugging
-                if self.verbose:
-                    self.logger.debug(f"Unhandled node kind: {node.kind}, spelling: {node.spelling}")
+                debug(f"Unhandled node kind: {kind}, spelling: {node.spelling}")
+
+            if kind in _NO_DESCEND_KINDS:
+                continue
 
-            # Continue traversal for children
-            for child in node.get_children():
-                traverse(child, depth + 1)
+            # Continue traversal for children, reversed so they pop in source order
+            children = list(node.get_children())
+            children.reverse()
+            stack.extend(children)
 
-        traverse(tu.cursor)
         return java_ast
 
+    def _ast_cache_key(self, cpp_code: str, source_file_path: Optional[str] = None) -> str:
+        """Compute the persistent AST cache key for a conversion"""
+        from .ast_cache import _ast_cache_key
+        return _ast_cache_key(self, cpp_code, source_file_path)
+
+    def _get_ast_cache(self):
+        """Get the persistent AST cache connection"""
+        from .ast_cache import _get_ast_cache
+        return _get_ast_cache(self)
+
+    def _load_cached_ast(self, key: str):
+        """Load a transformed AST from the persistent cache"""
+        from .ast_cache import _load_cached_ast
+        return _load_cached_ast(self, key)
+
+    def _store_cached_ast(self, key: str, java_ast: List[Any], tu) -> None:
+        """Store a transformed AST in the persistent cache"""
+        from .ast_cache import _store_cached_ast
+        return _store_cached_ast(self, key, java_ast, tu)
+
+    def _load_saved_tu(self, source_file_path: str):
+        """Load the saved translation unit of an unchanged source file"""
+        from .ast_cache import _load_saved_tu
+        return _load_saved_tu(self, source_file_path)
+
+    def _save_tu(self, tu, source_file_path: str) -> None:
+        """Save a translation unit for later conversions of the same source file"""
+        from .ast_cache import _save_tu
+        return _save_tu(self, tu, source_file_path)
+
     def _handle_class_declaration(self, node) -> Dict[str, Any]:
         """Handle C++ class declaration and convert to Java class"""
         from .handlers import _handle_class_declaration
@@ -286,18 +380,25 @@ class CppToJavaConverter:
         from .helpers import _get_access_level
         return _get_access_level(self, node)
 
+    def _get_location(self, node) -> str:
+        """Get the 'file:line' location string of a cursor"""
+        from .helpers import _get_location
+        return _get_location(self, node)
+
     def _handle_unsupported_feature(self, feature_name: str, node) -> None:
         """Handle unsupported C++ features"""
         from .helpers import _handle_unsupported_feature
         return _handle_unsupported_feature(self, feature_name, node)
 
-    def _generate_java_code(self, java_ast: List[Any]) -> str:
-        from .code_generator import _generate_java_code
-        return _generate_java_code(self, java_ast)
+    def _write_java_code(self, java_ast: List[Any], out: TextIO) -> None:
+        """Write generated Java code to a text stream"""
+        from .code_generator import _write_java_code
+        return _write_java_code(self, java_ast, out)
 
-    def _generate_java_class(self, class_info: Dict[str, Any]) -> str:
-        from .code_generator import _generate_java_class
-        return _generate_java_class(self, class_info)
+    def _emit_java_class(self, class_info: Dict[str, Any], java_lines: List[str]) -> None:
+        """Append the lines of a Java class to a shared line list"""
+        from .code_generator import _emit_java_class
+        return _emit_java_class(self, class_info, java_lines)
 
     def _generate_java_method(self, method_info: Dict[str, Any], class_name: str) -> List[str]:
         """Generate Java method from C++ method info"""
@@ -315,11 +416,10 @@ class CppToJavaConverter:
         from .helpers import _map_template_type
         return _map_template_type(self, cpp_type, template_params)
 
-    def _generate_util_class(self, functions: List[Dict[str, Any]]) -> str:
-        """Generate a single utility class containing all global and template functions"""
-        from .code_generator import _generate_util_class
-        return _generate_util_class(self, functions)
-
+    def _emit_util_class(self, functions: List[Dict[str, Any]], lines: List[str]) -> None:
+        """Append the lines of the utility class to a shared line list"""
+        from .code_generator import _emit_util_class
+        return _emit_util_class(self, functions, lines)
 
     def _generate_globals_class(self, variables: List[Dict[str, Any]]) -> str:
         """Generate a class containing all global variables as static fields"""
@@ -331,11 +431,10 @@ class CppToJavaConverter:
         return _convert_namespace_to_package(self, namespace)
 
 
-    def _generate_java_enum(self, enum_info: Dict[str, Any]) -> str:
-        """Generate Java enum from C++ enum"""
-        from .code_generator import _generate_java_enum
-        return _generate_java_enum(self, enum_info)
-
+    def _emit_java_enum(self, enum_info: Dict[str, Any], lines: List[str]) -> None:
+        """Append the lines of a Java enum to a shared line list"""
+        from .code_generator import _emit_java_enum
+        return _emit_java_enum(self, enum_info, lines)
 
     def _generate_imports(self) -> str:
         """Generate Java import statements based on needed utilities"""
@@ -348,7 +447,7 @@ class CppToJavaConverter:
         return _cpp_to_java_type(self, cpp_type)
 
 
-    JAVA_RESERVED_WORDS = {
+    JAVA_RESERVED_WORDS = frozenset({
         'abstract', 'assert', 'boolean', 'break', 'byte', 'case', 'catch',
         'char', 'class', 'const', 'continue', 'default', 'do', 'double',
         'else', 'enum', 'extends', 'final', 'finally', 'float', 'for',
@@ -357,8 +456,9 @@ class CppToJavaConverter:
         'protected', 'public', 'return', 'short', 'static', 'strictfp',
         'super', 'switch', 'synchronized', 'this', 'throw', 'throws',
         'transient', 'try', 'void', 'volatile', 'while', 'true', 'false', 'null'
-    }
-    JAVA_RESERVED_LOWER = {word.lower() for word in JAVA_RESERVED_WORDS}
+    })
+    # Every reserved word is already lowercase, so the lowercase lookup set is the same object
+    JAVA_RESERVED_LOWER = JAVA_RESERVED_WORDS
 
     def _cpp_name_to_java_name(self, cpp_name: str, naming_convention: str = "camelCase") -> str:
         """Convert C++ name to Java name following Java conventions"""
@@ -375,6 +475,98 @@ class CppToJavaConverter:
         return generate_report(self)
 
 
+# Converter owned by a convert_many() worker process
+_WORKER_CONVERTER: Optional[CppToJavaConverter] = None
+
+
+def _init_worker(mode: str, cache_dir: Optional[str], verbose: bool = False) -> None:
+    """Create the converter reused by every file a worker process handles"""
+    global _WORKER_CONVERTER
+    _WORKER_CONVERTER = CppToJavaConverter(mode=mode, verbose=verbose, cache_dir=cache_dir)
+
+
+def _convert_path(path: str) -> Dict[str, Any]:
+    """Convert one source file inside a worker process"""
+    converter = _WORKER_CONVERTER
+    converter.logger.info("Processing: %s", path)
+    # Monotonic clock: per-file timings never go negative on wall clock adjustments
+    start_ns = time.perf_counter_ns()
+    cpp_code = None
+    java_code = None
+    error = None
+    try:
+        # One read and one decode; newlines are normalized as text mode would
+        with open(path, 'rb') as f:
+            cpp_code = f.read().decode('utf-8')
+        if '\r' in cpp_code:
+            cpp_code = cpp_code.replace('\r\n', '\n').replace('\r', '\n')
+        java_code = converter.convert(cpp_code, path)
+    except Exception as e:
+        error = str(e)
+
+    return {
+        'path': path,
+        'java_code': java_code,
+        'error': error,
+        'processing_time': (time.perf_counter_ns() - start_ns) / 1e9,
+        'size_original': len(cpp_code) if cpp_code is not None else 0,
+        'ast_nodes': converter.last_ast_nodes,
+        'report': converter.generate_report()
+    }
+
+
+def iter_convert_many(paths: List[str], mode: str = "strict", cache_dir: Optional[str] = None,
+                      max_workers: Optional[int] = None, verbose: bool = False) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Convert several C++ source files, yielding (index, result) as each file finishes
+
+    Takes the same arguments as convert_many. With a single worker the files are converted
+    in this process, in input order. Closing the iterator early (e.g. after the first
+    failure) cancels the files that have not started yet.
+    """
+    paths = [str(path) for path in paths]
+    if not paths:
+        return
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if max_workers <= 1:
+        _init_worker(mode, cache_dir, verbose)
+        for index, path in enumerate(paths):
+            yield index, _convert_path(path)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                               initargs=(mode, cache_dir, verbose))
+    try:
+        futures = {pool.submit(_convert_path, path): index for index, path in enumerate(paths)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def convert_many(paths: List[str], mode: str = "strict", cache_dir: Optional[str] = None,
+                 max_workers: Optional[int] = None, verbose: bool = False) -> List[Dict[str, Any]]:
+    """
+    Convert several C++ source files in parallel worker processes
+
+    Args:
+        paths (list): Paths of the C++ source files
+        mode (str): "strict" or "flexible" conversion mode
+        cache_dir (str, optional): Persistent AST cache directory shared by all workers
+        max_workers (int, optional): Number of worker processes (defaults to the CPU count)
+        verbose (bool): Enable verbose logging in the workers
+
+    Returns:
+        list: One result per path, in input order, with the Java code (None on failure),
+        the error message, timing, input size, AST node count and the conversion report
+    """
+    results = [None] * len(paths)
+    for index, result in iter_convert_many(paths, mode, cache_dir, max_workers, verbose):
+        results[index] = result
+    return results
+
+
 # Test function to demonstrate the converter
 def test_converter():
     """Test the converter with sample C++ code"""
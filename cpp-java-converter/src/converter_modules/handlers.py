@@ -3,6 +3,12 @@ import re
 from typing import Any, Dict, List
 
 
+_MACRO_OP_RE = re.compile(r'[-+*/%<>!=&|^~(),\s]+')
+
+# Older libclang bindings lack Cursor.is_const_method
+_HAS_IS_CONST_METHOD = hasattr(clang.cindex.Cursor, 'is_const_method')
+
+
 def _handle_class_declaration(self, node) -> Dict[str, Any]:
     """Handle C++ class declaration and convert to Java class"""
     class_info = {
@@ -17,7 +23,7 @@ def _handle_class_declaration(self, node) -> Dict[str, Any]:
         'is_abstract': False,
         'is_final': False,
         'templates': [],
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
     for child in node.get_children():
@@ -78,7 +84,7 @@ def _handle_function_declaration(self, node) -> Dict[str, Any]:
         'is_static': False,
         'is_virtual': False,
         'is_const': False,
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -90,7 +96,7 @@ def _handle_variable_declaration(self, node) -> Dict[str, Any]:
         'type': node.type.spelling,
         'is_static': node.storage_class == clang.cindex.StorageClass.STATIC,
         'is_const': node.type.is_const_qualified(),
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -99,7 +105,7 @@ def _handle_namespace(self, node) -> Dict[str, Any]:
         'kind': 'namespace',
         'name': node.spelling,
         'children': [self._handle_namespace_child(child) for child in node.get_children()],
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -109,7 +115,7 @@ def _handle_template_parameter(self, node) -> Dict[str, Any]:
         'kind': 'template_param',
         'name': node.spelling or 'T',
         'type': 'typename',
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -119,7 +125,7 @@ def _handle_constructor(self, node) -> Dict[str, Any]:
         'kind': 'constructor',
         'name': node.spelling,
         'parameters': [self._handle_param(param) for param in node.get_arguments()],
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -128,13 +134,21 @@ def _handle_destructor(self, node) -> Dict[str, Any]:
     return {
         'kind': 'destructor',
         'name': node.spelling,
-        'location': f"{node.location.file}:{node.location.line}",
+        'location': self._get_location(node),
         'needs_raii_emulation': True
     }
 
 
 def _handle_method(self, node) -> Dict[str, Any]:
     """Handle C++ method"""
+    is_override = is_final = False
+    for child in node.get_children():
+        child_kind = child.kind
+        if child_kind == clang.cindex.CursorKind.CXX_OVERRIDE_ATTR:
+            is_override = True
+        elif child_kind == clang.cindex.CursorKind.CXX_FINAL_ATTR:
+            is_final = True
+
     method_info = {
         'kind': 'method',
         'name': node.spelling,
@@ -142,11 +156,11 @@ def _handle_method(self, node) -> Dict[str, Any]:
         'parameters': [self._handle_param(param) for param in node.get_arguments()],
         'is_static': node.is_static_method(),
         'is_virtual': node.is_virtual_method(),
-        'is_const': hasattr(node, 'is_const_method') and node.is_const_method(),
-        'is_override': any(child.kind == clang.cindex.CursorKind.CXX_OVERRIDE_ATTR for child in node.get_children()),
-        'is_final': any(child.kind == clang.cindex.CursorKind.CXX_FINAL_ATTR for child in node.get_children()),
+        'is_const': _HAS_IS_CONST_METHOD and node.is_const_method(),
+        'is_override': is_override,
+        'is_final': is_final,
         'access': self._get_access_level(node),
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -165,7 +179,7 @@ def _handle_typedef(self, node) -> Dict[str, Any]:
         'kind': 'typedef',
         'name': node.spelling,
         'underlying_type': underlying_type,
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -181,7 +195,7 @@ def _handle_macro_definition(self, node) -> Dict[str, Any]:
                 'kind': 'macro_constant',
                 'name': node.spelling,
                 'value': macro_text.strip(),
-                'location': f"{node.location.file}:{node.location.line}"
+                'location': self._get_location(node)
             }
         else:
 
@@ -192,7 +206,7 @@ def _handle_macro_definition(self, node) -> Dict[str, Any]:
         'kind': 'macro',
         'name': node.spelling,
         'raw_text': ' '.join([token.spelling for token in node.get_tokens()]),
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -204,7 +218,7 @@ def _is_constant_macro(self, macro_text: str) -> bool:
     if text.startswith('"') and text.endswith('"'):
         return True
 
-    cleaned = re.sub(r'[-+*/%<>!=&|^~(),\s]+', '', text)
+    cleaned = _MACRO_OP_RE.sub('', text)
     return cleaned.replace('.', '').replace('_', '').isdigit()
 
 
@@ -222,7 +236,7 @@ def _handle_enum_declaration(self, node) -> Dict[str, Any]:
         'kind': 'enum',
         'name': node.spelling,
         'values': enum_values,
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -230,28 +244,28 @@ def _handle_class_template(self, node) -> Dict[str, Any]:
     """Handle class template"""
     template_params = []
     class_decl_node = None
+    struct_decl_node = None
 
     for child in node.get_children():
-        if child.kind == clang.cindex.CursorKind.TEMPLATE_TYPE_PARAMETER:
+        child_kind = child.kind
+        if child_kind == clang.cindex.CursorKind.TEMPLATE_TYPE_PARAMETER:
             template_params.append({
                 'name': child.spelling,
                 'type': 'typename'
             })
-        elif child.kind == clang.cindex.CursorKind.TEMPLATE_NON_TYPE_PARAMETER:
+        elif child_kind == clang.cindex.CursorKind.TEMPLATE_NON_TYPE_PARAMETER:
             template_params.append({
                 'name': child.spelling,
                 'type': child.type.spelling,
                 'is_non_type': True
             })
-        elif child.kind == clang.cindex.CursorKind.CLASS_DECL:
+        elif child_kind == clang.cindex.CursorKind.CLASS_DECL:
             class_decl_node = child
+        elif child_kind == clang.cindex.CursorKind.STRUCT_DECL and struct_decl_node is None:
+            struct_decl_node = child
 
     if class_decl_node is None:
-
-        for child in node.get_children():
-            if child.kind == clang.cindex.CursorKind.STRUCT_DECL:
-                class_decl_node = child
-                break
+        class_decl_node = struct_decl_node
 
     class_body = {}
     if class_decl_node:
@@ -267,7 +281,7 @@ def _handle_class_template(self, node) -> Dict[str, Any]:
             'destructors': [],
             'base_classes': [],
             'is_final': False,
-            'location': f"{node.location.file}:{node.location.line}"
+            'location': self._get_location(node)
         }
 
     return {
@@ -275,7 +289,7 @@ def _handle_class_template(self, node) -> Dict[str, Any]:
         'name': node.spelling,
         'template_parameters': template_params,
         'class_info': class_body,
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -296,7 +310,7 @@ def _handle_function_template(self, node) -> Dict[str, Any]:
         'name': node.spelling,
         'template_parameters': template_params,
         'function_info': func_info,
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -306,7 +320,7 @@ def _handle_conversion_function(self, node) -> Dict[str, Any]:
         'kind': 'conversion_operator',
         'target_type': node.result_type.spelling,
         'method_name': self._convert_operator_name(node.spelling),
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -315,7 +329,7 @@ def _handle_cast_operator(self, node) -> Dict[str, Any]:
     return {
         'kind': 'cast_operator',
         'target_type': node.result_type.spelling,
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -328,7 +342,7 @@ def _handle_field(self, node) -> Dict[str, Any]:
         'is_static': node.storage_class == clang.cindex.StorageClass.STATIC,
         'is_const': node.type.is_const_qualified(),
         'access': self._get_access_level(node),
-        'location': f"{node.location.file}:{node.location.line}"
+        'location': self._get_location(node)
     }
 
 
@@ -357,5 +371,5 @@ def _handle_namespace_child(self, child_node):
         return {
             'kind': str(child_node.kind),
             'spelling': child_node.spelling,
-            'location': f"{child_node.location.file}:{child_node.location.line}"
+            'location': self._get_location(child_node)
         }
\ No newline at end of file
@@ -1,23 +1,100 @@
 import clang.cindex
 import re
+import sys
 from typing import Any, Dict, List
 import time
+from functools import lru_cache
+
+
+_NS_SPLIT = re.compile(r'::|\.')
+
+_NAME_SEPARATORS = str.maketrans('-_', '  ')
+
+_JAVA_KEYWORDS = frozenset({
+    'abstract', 'assert', 'boolean', 'break', 'byte', 'case', 'catch',
+    'char', 'class', 'const', 'continue', 'default', 'do', 'double',
+    'else', 'enum', 'extends', 'final', 'finally', 'float', 'for',
+    'goto', 'if', 'implements', 'import', 'instanceof', 'int',
+    'interface', 'long', 'native', 'new', 'package', 'private',
+    'protected', 'public', 'return', 'short', 'static', 'strictfp',
+    'super', 'switch', 'synchronized', 'this', 'throw', 'throws',
+    'transient', 'try', 'void', 'volatile', 'while'
+})
+
+_ACCESS_MAP = {
+    clang.cindex.AccessSpecifier.PUBLIC: 'public',
+    clang.cindex.AccessSpecifier.PROTECTED: 'protected',
+    clang.cindex.AccessSpecifier.PRIVATE: 'private',
+    clang.cindex.AccessSpecifier.INVALID: 'public'
+}
+
+_DEFAULTS = {
+    'boolean': 'false',
+    'int': '0',
+    'long': '0L',
+    'float': '0.0f',
+    'double': '0.0',
+    'char': "'\\0'",
+    'byte': '(byte)0',
+    'short': '(short)0'
+}
+
+
+class _OperatorNameMap(dict):
+    """Operator name table that synthesizes and caches names for unknown operators"""
+
+    def __missing__(self, op_name: str) -> str:
+        if op_name.startswith('operator'):
+            java_name = 'op' + op_name[8:].replace(' ', '_')
+        else:
+            java_name = op_name
+        self[op_name] = java_name
+        return java_name
+
+
+_OP_MAPPING = _OperatorNameMap({
+    'operator+': 'plus',
+    'operator-': 'minus',
+    'operator*': 'times',
+    'operator/': 'dividedBy',
+    'operator%': 'modulo',
+    'operator==': 'isEqualTo',
+    'operator!=': 'isNotEqualTo',
+    'operator<': 'isLessThan',
+    'operator>': 'isGreaterThan',
+    'operator<=': 'isLessThanOrEqual',
+    'operator>=': 'isGreaterThanOrEqual',
+    'operator&&': 'logicalAnd',
+    'operator||': 'logicalOr',
+    'operator!': 'logicalNot',
+    'operator&': 'bitwiseAnd',
+    'operator|': 'bitwiseOr',
+    'operator^': 'bitwiseXor',
+    'operator<<': 'leftShift',
+    'operator>>': 'rightShift',
+    'operator++': 'increment',
+    'operator--': 'decrement',
+    'operator=': 'assign',
+    'operator[]': 'get',
+    'operator->': 'arrow'
+})
 
 
 def _get_access_level(self, node) -> str:
     """Get access level (public, private, protected) for a node"""
-    access_map = {
-        clang.cindex.AccessSpecifier.PUBLIC: 'public',
-        clang.cindex.AccessSpecifier.PROTECTED: 'protected',
-        clang.cindex.AccessSpecifier.PRIVATE: 'private',
-        clang.cindex.AccessSpecifier.INVALID: 'public'
-    }
-    return access_map.get(node.access_specifier, 'public')
+    return _ACCESS_MAP.get(node.access_specifier, 'public')
+
+
+def _get_location(self, node) -> str:
+    """Get the 'file:line' location of a cursor"""
+    source_location = node.location
+    # Interned so that cursors on the same line share one string
+    return sys.intern(f"{source_location.file}:{source_location.line}")
 
 
 def _handle_unsupported_feature(self, feature_name: str, node) -> None:
     """Handle unsupported C++ features"""
-    msg = f"Unsupported C++ feature '{feature_name}' found at {node.location.file}:{node.location.line}"
+    msg = f"Unsupported C++ feature '{feature_name}' found at {self._get_location(node)}"
 
     if self.mode == "strict":
         raise ValueError(msg)
@@ -27,75 +104,67 @@ def _handle_unsupported_feature(self, feature_name: str, node) -> None:
 
 def _get_default_value(self, java_type: str) -> str:
     """Get default return value for a Java type"""
-    defaults = {
-        'boolean': 'false',
-        'int': '0',
-        'long': '0L',
-        'float': '0.0f',
-        'double': '0.0',
-        'char': "'\\0'",
-        'byte': '(byte)0',
-        'short': '(short)0'
-    }
-    return defaults.get(java_type, 'null')
+    return _DEFAULTS.get(java_type, 'null')
 
 
 def _map_template_type(self, cpp_type: str, template_params: List[Dict[str, Any]]) -> str:
-
-    java_type = self._cpp_to_java_type(cpp_type)
-
-    for param in template_params:
-        if param.get('is_non_type', False):
-            continue
-        param_name = param['name']
-
-        java_type = re.sub(r'\b' + re.escape(param_name) + r'\b', param_name, java_type)
-
-    return java_type
+    # Type parameter names already pass through the type mapper unchanged,
+    # so no per-parameter substitution is needed
+    return self._cpp_to_java_type(cpp_type)
 
 
 def _convert_namespace_to_package(self, namespace: str) -> str:
-    pkg = namespace.replace('::', '.')
-
-    java_keywords = {
-        'abstract', 'assert', 'boolean', 'break', 'byte', 'case', 'catch',
-        'char', 'class', 'const', 'continue', 'default', 'do', 'double',
-        'else', 'enum', 'extends', 'final', 'finally', 'float', 'for',
-        'goto', 'if', 'implements', 'import', 'instanceof', 'int',
-        'interface', 'long', 'native', 'new', 'package', 'private',
-        'protected', 'public', 'return', 'short', 'static', 'strictfp',
-        'super', 'switch', 'synchronized', 'this', 'throw', 'throws',
-        'transient', 'try', 'void', 'volatile', 'while'
-    }
+    return '.'.join(_package_part(part) for part in _NS_SPLIT.split(namespace) if part)
 
-    parts = []
-    for part in pkg.split('.'):
-        clean_part = part.lower()
-        if clean_part in java_keywords:
-            clean_part = f"_{clean_part}"
-        if clean_part and clean_part[0].isdigit():
-            clean_part = f"_{clean_part}"
-        parts.append(clean_part)
 
-    return '.'.join(parts)
+def _package_part(part: str) -> str:
+    """Lowercase a namespace component and escape keywords/leading digits"""
+    clean_part = part.lower()
+    if clean_part in _JAVA_KEYWORDS or clean_part[0].isdigit():
+        return f"_{clean_part}"
+    return clean_part
 
 
 def _cpp_name_to_java_name(self, cpp_name: str, naming_convention: str = "camelCase") -> str:
+    return _cpp_name_to_java_name_impl(cpp_name, naming_convention, self.JAVA_RESERVED_LOWER)
+
+
+@lru_cache(maxsize=8192)
+def _cpp_name_to_java_name_impl(cpp_name: str, naming_convention: str, reserved: frozenset) -> str:
+    """Pure, memoized implementation of _cpp_name_to_java_name"""
     if not cpp_name:
         return cpp_name
 
-    if cpp_name.lower() in self.JAVA_RESERVED_LOWER:
+    lowered = cpp_name.lower()
+    if lowered in reserved:
         return f"_{cpp_name}"
 
+    # Fast path: identifiers without separators need no splitting
+    if '_' not in cpp_name and '-' not in cpp_name:
+        java_name = cpp_name.capitalize() if naming_convention == "PascalCase" else lowered
+        if not (java_name[0].isalpha() or java_name[0] == '_'):
+            java_name = '_' + java_name
+        return java_name
+
+    # str.title() capitalizes like per-part capitalize() only for purely alphabetic parts
+    words = cpp_name.translate(_NAME_SEPARATORS)
+    letters = words.replace(' ', '')
+    if letters.isascii() and letters.isalpha():
+        java_name = words.title().replace(' ', '')
+        if naming_convention == "PascalCase":
+            return java_name
+        return java_name[0].lower() + java_name[1:]
+
     parts = [part for part in cpp_name.replace('-', '_').split('_') if part]
 
     if not parts:
         return "_unnamed"
 
+    # str.join materializes its argument anyway, so hand it a list rather than a generator
     if naming_convention == "PascalCase":
-        java_name = ''.join(part.capitalize() for part in parts)
+        java_name = ''.join([part.capitalize() for part in parts])
     else:  
-        java_name = parts[0].lower() + ''.join(part.capitalize() for part in parts[1:])
+        java_name = parts[0].lower() + ''.join([part.capitalize() for part in parts[1:]])
 
     if not (java_name[0].isalpha() or java_name[0] == '_'):
         java_name = '_' + java_name
@@ -104,41 +173,7 @@ def _cpp_name_to_java_name(self, cpp_name: str, naming_convention: str = "camelC
 
 
 def _convert_operator_name(self, op_name: str) -> str:
-    op_mapping = {
-        'operator+': 'plus',
-        'operator-': 'minus',
-        'operator*': 'times',
-        'operator/': 'dividedBy',
-        'operator%': 'modulo',
-        'operator==': 'isEqualTo',          
-        'operator!=': 'isNotEqualTo',
-        'operator<': 'isLessThan',
-        'operator>': 'isGreaterThan',
-        'operator<=': 'isLessThanOrEqual',
-        'operator>=': 'isGreaterThanOrEqual',
-        'operator&&': 'logicalAnd',
-        'operator||': 'logicalOr',
-        'operator!': 'logicalNot',
-        'operator&': 'bitwiseAnd',
-        'operator|': 'bitwiseOr',
-        'operator^': 'bitwiseXor',
-        'operator<<': 'leftShift',
-        'operator>>': 'rightShift',
-        'operator++': 'increment',
-        'operator--': 'decrement',
-        'operator=': 'assign',
-        'operator[]': 'get',
-        'operator->': 'arrow'
-    }
-
-    result = op_mapping.get(op_name)
-    if result is not None:
-        return result
-
-    if op_name.startswith('operator'):
-        return 'op' + op_name[8:].replace(' ', '_')
-
-    return op_name
+    return _OP_MAPPING[op_name]
 
 
 def generate_report(self) -> Dict[str, Any]:
@@ -146,7 +181,7 @@ def generate_report(self) -> Dict[str, Any]:
     return {
         'metadata': {
             'mode': self.mode,
-            'timestamp': time.time(),
+            'timestamp': self._last_end_time if self._last_end_time is not None else time.time(),
             'processed_nodes': self.ast_node_count
         },
         'stats': dict(self.last_conversion_stats) if self.last_conversion_stats else {},
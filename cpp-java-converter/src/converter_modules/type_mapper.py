@@ -1,38 +1,63 @@
 """Type mapping functions for the converter"""
 
 import re
+import sys
+from functools import lru_cache
 
 
-def _cpp_to_java_type(self, cpp_type: str) -> str:
-    """Convert C++ type to Java type"""
-    # Очищаем от const, volatile и т.п.
-    clean_type = re.sub(r'\b(const|volatile|mutable|struct|class)\s+', '', cpp_type).strip()
-
-    cpp_to_java_types = {
+_CPP_TO_JAVA_TYPES = {
+    sys.intern(cpp): sys.intern(java) for cpp, java in {
         'int': 'int', 'long': 'long', 'short': 'short', 'char': 'byte',
         'wchar_t': 'char', 'bool': 'boolean', 'float': 'float', 'double': 'double',
         'void': 'void', 'unsigned int': 'int', 'unsigned long': 'long',
         'unsigned short': 'short', 'unsigned char': 'byte', 'signed char': 'byte',
         'long long': 'long', 'unsigned long long': 'long',
         'size_t': 'long', 'std::string': 'String', 'string': 'String'
-    }
+    }.items()
+}
+
+_QUALIFIERS = frozenset({'const', 'volatile', 'mutable', 'struct', 'class'})
+_QUALIFIER_RE = re.compile(r'\b(const|volatile|mutable|struct|class)\s+')
+
+
+def _cpp_to_java_type(self, cpp_type: str) -> str:
+    """Convert C++ type to Java type"""
+    return _cpp_to_java_type_impl(cpp_type)
+
+
+@lru_cache(maxsize=8192)
+def _cpp_to_java_type_impl(cpp_type: str) -> str:
+    """Pure, memoized implementation of _cpp_to_java_type"""
+    # Plain basic types (no qualifiers or sigils) are a single table lookup
+    java_type = _CPP_TO_JAVA_TYPES.get(cpp_type)
+    if java_type is not None:
+        return java_type
+
+    # Очищаем от const, volatile и т.п.
+    if '<' in cpp_type or '(' in cpp_type:
+        # Qualifiers may be glued to '<' or '(' here, so fall back to the regex
+        clean_type = _QUALIFIER_RE.sub('', cpp_type).strip()
+    else:
+        clean_type = ' '.join(token for token in cpp_type.split() if token not in _QUALIFIERS)
+
+    star = clean_type.find('*')
+    bracket = clean_type.find('[') if star < 0 else -1
 
     # Указатели → массивы
-    if '*' in clean_type:
-        base_part = clean_type.split('*')[0].strip()
-        java_base = cpp_to_java_types.get(base_part, base_part)
-        return java_base + '[]'
+    if star >= 0:
+        base_part = clean_type[:star].strip()
+        java_base = _CPP_TO_JAVA_TYPES.get(base_part, base_part)
+        return sys.intern(java_base + '[]')
 
     # Массивы
-    if '[' in clean_type and ']' in clean_type:
+    if bracket >= 0 and clean_type.find(']', bracket) >= 0:
         # Берём часть до первой [
-        base_part = clean_type.split('[')[0].strip()
-        java_base = cpp_to_java_types.get(base_part, base_part)
-        dim_count = clean_type.count('[')
-        return java_base + '[]' * dim_count
+        base_part = clean_type[:bracket].strip()
+        java_base = _CPP_TO_JAVA_TYPES.get(base_part, base_part)
+        dim_count = clean_type.count('[', bracket)
+        return sys.intern(java_base + '[]' * dim_count)
 
     # Ссылки → обычный тип
-    if clean_type.endswith('&'):
-        clean_type = clean_type[:-1].strip()
+    clean_type = sys.intern(clean_type.removesuffix('&').rstrip())
 
-    return cpp_to_java_types.get(clean_type, clean_type)
\ No newline at end of file
+    return _CPP_TO_JAVA_TYPES.get(clean_type, clean_type)
@@ -0,0 +1,106 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import cli  # noqa: E402
+
+
+GOOD_SOURCE = """
+class Point {
+public:
+    int x;
+    int y;
+};
+"""
+
+# Heavy includes make the failing file finish after the good one under -j 2
+BAD_SOURCE = """
+#include <iostream>
+#include <map>
+#include <regex>
+#include <vector>
+
+class Broken {
+public:
+    undeclared_type value;
+};
+"""
+
+
+def run_cli(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["cli.py", *map(str, args)])
+    return cli.main()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_strict_failure_report_totals_match_file_list(tmp_path, monkeypatch, jobs):
+    (tmp_path / "a_bad.cpp").write_text(BAD_SOURCE)
+    (tmp_path / "b_good.cpp").write_text(GOOD_SOURCE)
+    report_path = tmp_path / "report.json"
+
+    exit_code = run_cli(monkeypatch, "-i", tmp_path / "a_bad.cpp", tmp_path / "b_good.cpp",
+                        "-o", tmp_path / "out", "-j", jobs, "--report", report_path)
+
+    report = json.loads(report_path.read_text())
+    assert exit_code == 1
+    assert report["failure_count"] == 1
+    assert len(report["errors"]) == 1
+    assert report["success_count"] == len(report["files_processed"])
+    assert report["total_ast_nodes"] == sum(f["ast_nodes_processed"] for f in report["files_processed"])
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_strict_failure_skips_later_files(tmp_path, monkeypatch, jobs):
+    (tmp_path / "a_bad.cpp").write_text(BAD_SOURCE)
+    (tmp_path / "b_good.cpp").write_text(GOOD_SOURCE)
+    report_path = tmp_path / "report.json"
+
+    exit_code = run_cli(monkeypatch, "-i", tmp_path / "a_bad.cpp", tmp_path / "b_good.cpp",
+                        "-o", tmp_path / "out", "-j", jobs, "--report", report_path)
+
+    report = json.loads(report_path.read_text())
+    assert exit_code == 1
+    assert report["files_processed"] == []
+    assert not (tmp_path / "out" / "b_good.java").exists()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_strict_failure_keeps_earlier_files(tmp_path, monkeypatch, jobs):
+    (tmp_path / "a_good.cpp").write_text(GOOD_SOURCE)
+    (tmp_path / "b_bad.cpp").write_text(BAD_SOURCE)
+    report_path = tmp_path / "report.json"
+
+    exit_code = run_cli(monkeypatch, "-i", tmp_path / "a_good.cpp", tmp_path / "b_bad.cpp",
+                        "-o", tmp_path / "out", "-j", jobs, "--report", report_path)
+
+    report = json.loads(report_path.read_text())
+    assert exit_code == 1
+    assert [Path(f["original_path"]).name for f in report["files_processed"]] == ["a_good.cpp"]
+    assert (tmp_path / "out" / "a_good.java").exists()
+
+
+def test_suppressed_messages_are_counted_but_not_listed(tmp_path):
+    messages = cli._MessageSet(limit=2)
+    for message in ["a", "a", "b", "c", "d"]:
+        messages.add(message)
+    assert list(messages) == ["a", "b"]
+    assert messages.suppressed == 2
+
+    report_data = {
+        "files_processed": [],
+        "warnings": [],
+        "errors": list(messages),
+        "suppressed_messages": {"warnings": 0, "errors": messages.suppressed}
+    }
+    report_path = tmp_path / "report.txt"
+    cli.write_report(report_data, str(report_path), "txt")
+
+    text = report_path.read_text()
+    assert "Errors: 4\n" in text
+    assert "0 warnings, 2 errors" in text
+    assert "\nErrors:\n  - a\n  - b\n" in text
+    assert "  - c" not in text